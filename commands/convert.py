@@ -0,0 +1,35 @@
+#!/usr/bin/env python3
+
+from pathlib import Path
+from utils.dataset import json_to_dataset, dataset_to_json, dataset_path_for, DATASET_SUFFIX
+
+
+def run_convert(to="dataset"):
+    """Convert data files between JSON and the indexed dataset format"""
+    data_dir = Path("data")
+
+    if not data_dir.exists():
+        print("✗ Data directory not found. Please run 'python main.py formbricks generate' first.")
+        return
+
+    if to == "dataset":
+        print("Converting JSON data files to indexed datasets...")
+        sources = sorted(data_dir.glob("*.json"))
+    else:
+        print("Converting indexed datasets to JSON data files...")
+        sources = sorted(data_dir.glob(f"*{DATASET_SUFFIX}"))
+
+    if not sources:
+        print("✗ No data files found to convert.")
+        return
+
+    for source in sources:
+        if to == "dataset":
+            target = dataset_path_for(source)
+            count = json_to_dataset(source, target)
+        else:
+            target = source.with_suffix(".json")
+            count = dataset_to_json(source, target)
+        print(f"  ✓ {source} -> {target} ({count} records)")
+
+    print("\n✓ Conversion complete!")
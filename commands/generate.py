@@ -2,8 +2,12 @@
 
 import json
 import os
+from functools import partial
 from pathlib import Path
 from utils.llm import generate_surveys, generate_users
+from utils.dataset import write_dataset, dataset_path_for
+from utils.profiling import phase
+from utils.dedup import dedupe, SurveyDeduplicator, UserDeduplicator
 
 
 def run_generate():
@@ -14,20 +18,46 @@ def run_generate():
     data_dir.mkdir(exist_ok=True)
 
     print("\nGenerating 5 unique surveys...")
-    surveys = generate_surveys()
+    with phase("survey_generation"):
+        surveys = generate_surveys()
+
+    survey_dedup = SurveyDeduplicator()
+    surveys, replaced, dropped = dedupe(
+        surveys, survey_dedup, partial(generate_surveys, fallback=False), hint_field="name"
+    )
+    if replaced or dropped or survey_dedup.dropped_responses:
+        print(
+            f"✓ Replaced {replaced} and dropped {dropped} duplicate surveys, "
+            f"dropped {survey_dedup.dropped_responses} duplicate responses"
+        )
 
     surveys_file = data_dir / "surveys.json"
-    with open(surveys_file, "w") as f:
-        json.dump(surveys, f, indent=2)
+    surveys_dataset = dataset_path_for(surveys_file)
+    with phase("write_output"):
+        with open(surveys_file, "w") as f:
+            json.dump(surveys, f, separators=(",", ":"))
+        write_dataset(surveys_dataset, surveys)
     print(f"✓ Saved surveys to {surveys_file}")
+    print(f"✓ Indexed surveys in {surveys_dataset}")
 
     print("\nGenerating 10 unique users...")
-    users = generate_users()
+    with phase("user_generation"):
+        users = generate_users()
+
+    users, replaced, dropped = dedupe(
+        users, UserDeduplicator(), partial(generate_users, fallback=False), hint_field="email"
+    )
+    if replaced or dropped:
+        print(f"✓ Replaced {replaced} and dropped {dropped} duplicate users")
 
     users_file = data_dir / "users.json"
-    with open(users_file, "w") as f:
-        json.dump(users, f, indent=2)
+    users_dataset = dataset_path_for(users_file)
+    with phase("write_output"):
+        with open(users_file, "w") as f:
+            json.dump(users, f, separators=(",", ":"))
+        write_dataset(users_dataset, users)
     print(f"✓ Saved users to {users_file}")
+    print(f"✓ Indexed users in {users_dataset}")
 
     print("\n✓ Data generation complete!")
     print(f"  - Surveys: {surveys_file}")
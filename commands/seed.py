@@ -1,8 +1,9 @@
 #!/usr/bin/env python3
 
-import json
 from pathlib import Path
 from utils.api import FormbricksAPI
+from utils.dataset import open_records, dataset_path_for
+from utils.profiling import phase
 
 
 def run_seed():
@@ -18,33 +19,39 @@ def run_seed():
     surveys_file = data_dir / "surveys.json"
     users_file = data_dir / "users.json"
 
-    if not surveys_file.exists() or not users_file.exists():
+    has_surveys = surveys_file.exists() or dataset_path_for(surveys_file).exists()
+    has_users = users_file.exists() or dataset_path_for(users_file).exists()
+
+    if not has_surveys or not has_users:
         print("✗ Generated data files not found. Please run 'python main.py formbricks generate' first.")
         return
 
-    with open(surveys_file) as f:
-        surveys = json.load(f)
+    with open_records(surveys_file) as surveys, open_records(users_file) as users:
+        _seed(surveys, users)
 
-    with open(users_file) as f:
-        users = json.load(f)
 
+def _seed(surveys, users):
+    """Create users, surveys and responses from loaded records"""
     api = FormbricksAPI()
 
     print("\nSetting up users...")
     user_ids = {}
-    for user in users:
-        user_id = api.create_user(user)
-        user_ids[user["email"]] = user_id
-        print(f"  ✓ Created user: {user['email']}")
+    with phase("user_invites"):
+        for user in users:
+            user_id = api.create_user(user)
+            user_ids[user["email"]] = user_id
+            print(f"  ✓ Created user: {user['email']}")
 
     print("\nCreating surveys...")
     for survey in surveys:
-        survey_id = api.create_survey(survey)
+        with phase("survey_creation"):
+            survey_id = api.create_survey(survey)
         print(f"  ✓ Created survey: {survey['name']} (ID: {survey_id})")
 
         print(f"    Adding responses...")
-        for response in survey.get("responses", []):
-            api.create_response(survey_id, response)
+        with phase("response_posting"):
+            for response in survey.get("responses", []):
+                api.create_response(survey_id, response)
         print(f"    ✓ Added {len(survey.get('responses', []))} responses")
 
     print("\n✓ Seeding complete!")
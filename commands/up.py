@@ -5,6 +5,7 @@ import subprocess
 import time
 import requests
 from pathlib import Path
+from utils.profiling import phase
 
 
 def create_docker_compose():
@@ -85,22 +86,27 @@ def run_up():
 
     try:
         print("Pulling Docker images...")
-        subprocess.run(
-            ["docker-compose", "pull"],
-            check=True,
-            capture_output=True,
-        )
+        with phase("image_pull"):
+            subprocess.run(
+                ["docker-compose", "pull"],
+                check=True,
+                capture_output=True,
+            )
 
         print("Starting services with docker-compose...")
-        subprocess.run(
-            ["docker-compose", "up", "-d"],
-            check=True,
-        )
+        with phase("compose_up"):
+            subprocess.run(
+                ["docker-compose", "up", "-d"],
+                check=True,
+            )
 
         os.chdir("..")
 
         print("Waiting for Formbricks to be ready...")
-        if wait_for_service("http://localhost:3000/api/health"):
+        with phase("health_wait"):
+            healthy = wait_for_service("http://localhost:3000/api/health")
+
+        if healthy:
             print("✓ Formbricks is running at http://localhost:3000")
             print("✓ PostgreSQL is running on localhost:5432")
         else:
@@ -0,0 +1,232 @@
+#!/usr/bin/env python3
+
+import hashlib
+import json
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Any, List
+from utils.api import FormbricksAPI
+from utils.dataset import open_records, dataset_path_for
+from utils.profiling import phase
+
+SAMPLE_SIZE = 5
+SEED_ACCOUNT_DOMAIN = "@formbricks.local"
+
+
+def run_verify():
+    """Verify that seeded Formbricks data matches the generated dataset"""
+    print("Verifying seeded data against generated data...")
+
+    data_dir = Path("data")
+    surveys_file = data_dir / "surveys.json"
+    users_file = data_dir / "users.json"
+
+    has_surveys = surveys_file.exists() or dataset_path_for(surveys_file).exists()
+    has_users = users_file.exists() or dataset_path_for(users_file).exists()
+
+    if not has_surveys or not has_users:
+        print("✗ Generated data files not found. Please run 'python main.py formbricks generate' first.")
+        return
+
+    api = FormbricksAPI()
+
+    try:
+        with open_records(users_file) as users:
+            with phase("verify_members"):
+                members = _verify_members(api, users)
+
+        with open_records(surveys_file) as surveys:
+            with phase("verify_surveys"):
+                survey_report, remote_ids = _verify_surveys(api, surveys)
+            with phase("verify_responses"):
+                responses = _verify_responses(api, surveys, remote_ids)
+    finally:
+        api.close()
+
+    reports = {"members": members, "surveys": survey_report, "responses": responses}
+
+    print()
+    problems = 0
+    for label, report in reports.items():
+        problems += _print_report(label, report)
+
+    if problems:
+        raise RuntimeError(f"Verification found {problems} discrepant records")
+
+    print("\n✓ Verification complete! Formbricks matches the generated data.")
+
+
+def _digest(value: Any) -> str:
+    """Stable digest of a JSON-serialisable value"""
+    canonical = json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.blake2b(canonical.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _new_report() -> Dict[str, Any]:
+    """Empty report; each discrepancy is a (description, record count) pair"""
+    return {"matched": 0, "missing": [], "extra": [], "mismatched": []}
+
+
+def _member_digest(member: Dict[str, Any]) -> str:
+    return _digest(
+        {
+            "email": member.get("email", "").lower(),
+            "role": str(member.get("role", "manager")).lower(),
+        }
+    )
+
+
+def _verify_members(api: FormbricksAPI, users) -> Dict[str, Any]:
+    """Compare workspace members against the source users by email"""
+    report = _new_report()
+    expected = {user["email"].lower(): _member_digest(user) for user in users}
+
+    for member in api.list_members():
+        email = member.get("email", "").lower()
+        if email.endswith(SEED_ACCOUNT_DOMAIN):
+            continue
+
+        digest = expected.pop(email, None)
+        if digest is None:
+            report["extra"].append((email, 1))
+        elif digest != _member_digest(member):
+            report["mismatched"].append((email, 1))
+        else:
+            report["matched"] += 1
+
+    report["missing"].extend((email, 1) for email in expected)
+    return report
+
+
+def _text(value: Any) -> str:
+    """Unwrap Formbricks i18n strings such as {"default": "..."}"""
+    if isinstance(value, dict):
+        return value.get("default", "")
+    return value
+
+
+def _survey_digest(name: str, description: str, survey_type: str, questions: List[Dict[str, Any]]) -> str:
+    return _digest(
+        {
+            "name": name,
+            "description": description,
+            "type": survey_type,
+            "questions": questions,
+        }
+    )
+
+
+def _source_survey_digest(survey: Dict[str, Any]) -> str:
+    """Digest of a source survey, mirroring what FormbricksAPI.create_survey sends"""
+    questions = []
+    for q in survey.get("questions", []):
+        question = {"type": q.get("type", "openText"), "headline": q.get("question", "Question")}
+        if q.get("type") == "multipleChoice":
+            question["choices"] = list(q.get("choices", []))
+        questions.append(question)
+
+    return _survey_digest(
+        survey.get("name", "Survey"),
+        survey.get("description", ""),
+        survey.get("type", "form"),
+        questions,
+    )
+
+
+def _remote_survey_digest(survey: Dict[str, Any]) -> str:
+    """Digest of a survey as returned by the Management API"""
+    questions = []
+    for q in survey.get("questions", []):
+        question = {"type": q.get("type", "openText"), "headline": _text(q.get("headline", ""))}
+        if q.get("type") == "multipleChoice":
+            question["choices"] = [_text(c.get("label", "")) for c in q.get("choices", [])]
+        questions.append(question)
+
+    return _survey_digest(
+        survey.get("name", "Survey"),
+        survey.get("description", ""),
+        survey.get("type", "form"),
+        questions,
+    )
+
+
+def _verify_surveys(api: FormbricksAPI, surveys):
+    """Compare workspace surveys against the source surveys by name"""
+    report = _new_report()
+    expected = {survey.get("name", "Survey"): _source_survey_digest(survey) for survey in surveys}
+    remote_ids = {}
+
+    for survey in api.list_surveys():
+        name = survey.get("name", "Survey")
+        digest = expected.get(name)
+        if name in remote_ids or digest is None:
+            report["extra"].append((name, 1))
+            continue
+
+        remote_ids[name] = survey.get("id")
+        if digest != _remote_survey_digest(survey):
+            report["mismatched"].append((name, 1))
+        else:
+            report["matched"] += 1
+
+    report["missing"].extend((name, 1) for name in expected if name not in remote_ids)
+    return report, remote_ids
+
+
+def _verify_responses(api: FormbricksAPI, surveys, remote_ids: Dict[str, str]) -> Dict[str, Any]:
+    """Compare responses survey by survey as multisets of answer digests
+
+    Only one survey's source digests are held at a time and remote responses
+    are streamed page by page, so memory stays flat regardless of volume.
+    Responses carry no shared key with the source data, so differences are
+    reported as missing or extra rather than mismatched.
+    """
+    report = _new_report()
+
+    for survey in surveys:
+        name = survey.get("name", "Survey")
+        survey_id = remote_ids.get(name)
+        expected = Counter(_digest(r.get("data", {})) for r in survey.get("responses", []))
+
+        if survey_id is None:
+            missing = sum(expected.values())
+            if missing:
+                report["missing"].append((f"{name}: {missing} responses (survey not found)", missing))
+            continue
+
+        extra = 0
+        for response in api.list_responses(survey_id):
+            digest = _digest(response.get("data", {}))
+            if expected[digest] > 0:
+                expected[digest] -= 1
+                report["matched"] += 1
+            else:
+                extra += 1
+
+        missing = sum(expected.values())
+        if missing:
+            report["missing"].append((f"{name}: {missing} responses", missing))
+        if extra:
+            report["extra"].append((f"{name}: {extra} responses", extra))
+
+    return report
+
+
+def _print_report(label: str, report: Dict[str, Any]) -> int:
+    """Print one section of the verification report and return its discrepant record count"""
+    totals = {kind: sum(count for _, count in report[kind]) for kind in ("missing", "extra", "mismatched")}
+    problems = sum(totals.values())
+    mark = "✓" if not problems else "✗"
+    print(
+        f"{mark} {label.capitalize()}: {report['matched']} matched, "
+        f"{totals['missing']} missing, {totals['extra']} extra, "
+        f"{totals['mismatched']} mismatched"
+    )
+
+    for kind in ("missing", "extra", "mismatched"):
+        for description, _ in report[kind][:SAMPLE_SIZE]:
+            print(f"    {kind}: {description}")
+        if len(report[kind]) > SAMPLE_SIZE:
+            print(f"    ... and {len(report[kind]) - SAMPLE_SIZE} more {kind}")
+
+    return problems
@@ -6,13 +6,28 @@ from commands.up import run_up
 from commands.down import run_down
 from commands.generate import run_generate
 from commands.seed import run_seed
+from commands.convert import run_convert
+from commands.verify import run_verify
+from utils.profiling import profile_command
 
 
-def main():
+def build_parser():
     parser = argparse.ArgumentParser(
         description="Formbricks CLI - Manage local Formbricks instance"
     )
 
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Profile the command and write a report",
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default="profiles",
+        metavar="DIR",
+        help="Directory for profile reports (default: profiles)",
+    )
+
     subparsers = parser.add_subparsers(dest="service")
     formbricks_parser = subparsers.add_parser("formbricks")
 
@@ -21,25 +36,47 @@ def main():
     formbricks_subparsers.add_parser("down", help="Stop Formbricks")
     formbricks_subparsers.add_parser("generate", help="Generate realistic survey data")
     formbricks_subparsers.add_parser("seed", help="Seed Formbricks with generated data")
+    formbricks_subparsers.add_parser("verify", help="Verify seeded data against generated data")
+    convert_parser = formbricks_subparsers.add_parser(
+        "convert", help="Convert data files between JSON and indexed datasets"
+    )
+    convert_parser.add_argument(
+        "--to",
+        choices=["dataset", "json"],
+        default="dataset",
+        help="Target format (default: dataset)",
+    )
 
+    return parser, formbricks_parser
+
+
+def main():
+    parser, formbricks_parser = build_parser()
     args = parser.parse_args()
 
     if args.service != "formbricks":
         parser.print_help()
         sys.exit(1)
 
+    commands = {
+        "up": run_up,
+        "down": run_down,
+        "generate": run_generate,
+        "seed": run_seed,
+        "verify": run_verify,
+        "convert": lambda: run_convert(args.to),
+    }
+
+    command = commands.get(args.command)
+    if command is None:
+        formbricks_parser.print_help()
+        sys.exit(1)
+
     try:
-        if args.command == "up":
-            run_up()
-        elif args.command == "down":
-            run_down()
-        elif args.command == "generate":
-            run_generate()
-        elif args.command == "seed":
-            run_seed()
+        if args.profile:
+            profile_command(args.command, command, args.profile_dir)
         else:
-            formbricks_parser.print_help()
-            sys.exit(1)
+            command()
     except Exception as e:
         print(f"Error: {str(e)}", file=sys.stderr)
         sys.exit(1)
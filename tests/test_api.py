@@ -0,0 +1,119 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from utils.api import FormbricksAPI
+
+
+def _api(get_page):
+    # Skip __init__, which connects to a running Formbricks instance
+    api = FormbricksAPI.__new__(FormbricksAPI)
+    api._pool = None
+    api.session = requests.Session()
+    api._get_page = get_page
+    return api
+
+
+def _server(total, cap=None, ignore_paging=False):
+    items = [{"id": i} for i in range(total)]
+    calls = []
+
+    def get_page(url, params, skip, limit):
+        calls.append((skip, limit))
+        if ignore_paging:
+            return list(items)
+        limit = min(limit, cap) if cap else limit
+        return items[skip : skip + limit]
+
+    return items, calls, get_page
+
+
+@pytest.mark.parametrize("total", [0, 3, 100, 250, 1000])
+def test_reads_every_item_in_order(total):
+    items, calls, get_page = _server(total)
+    api = _api(get_page)
+    try:
+        assert list(api._paginate("url", page_size=100)) == items
+    finally:
+        api.close()
+
+    # Small endpoints cost at most two requests; larger ones overshoot by at most a window
+    assert len(calls) <= max(2, -(-total // 100) + 8)
+
+
+def test_capped_limit_reads_everything():
+    items, calls, get_page = _server(1234, cap=50)
+    api = _api(get_page)
+    try:
+        assert list(api._paginate("url", page_size=100)) == items
+    finally:
+        api.close()
+
+    assert calls[0] == (0, 100)
+    assert all(limit == 50 for _, limit in calls[1:])
+
+
+def test_stops_when_endpoint_ignores_skip_and_limit():
+    items, calls, get_page = _server(250, ignore_paging=True)
+    api = _api(get_page)
+    try:
+        assert list(api._paginate("url", page_size=100)) == items
+    finally:
+        api.close()
+
+    assert len(calls) <= 3
+
+
+def test_identical_content_with_distinct_ids_is_not_a_repeat():
+    def get_page(url, params, skip, limit):
+        return [{"id": skip + i, "data": {"q1": "yes"}} for i in range(limit)] if skip < 6 else []
+
+    api = _api(get_page)
+    try:
+        assert len(list(api._paginate("url", page_size=2))) == 6
+    finally:
+        api.close()
+
+
+def test_worker_errors_propagate():
+    def get_page(url, params, skip, limit):
+        if skip >= 4:
+            raise RuntimeError("server error")
+        return [{"id": skip + i} for i in range(limit)]
+
+    api = _api(get_page)
+    try:
+        with pytest.raises(RuntimeError, match="server error"):
+            list(api._paginate("url", page_size=2))
+    finally:
+        api.close()
+
+
+def test_closing_early_cancels_pending_pages():
+    release = threading.Event()
+    futures = []
+
+    def get_page(url, params, skip, limit):
+        if skip >= 6:
+            release.wait(5)
+        return [{"id": skip + i} for i in range(limit)]
+
+    api = _api(get_page)
+    api._pool = ThreadPoolExecutor(max_workers=1)
+    submit = api._pool.submit
+    api._pool.submit = lambda *args: futures.append(submit(*args)) or futures[-1]
+
+    try:
+        pages = api._paginate("url", page_size=2, concurrency=8)
+        assert [next(pages)["id"] for _ in range(6)] == list(range(6))
+        pages.close()
+
+        # The single worker is stuck on one page, so every page queued behind it is cancelled
+        queued = [f for f in futures if not f.running() and not f.done()]
+        assert not queued
+        assert any(f.cancelled() for f in futures)
+    finally:
+        release.set()
+        api.close()
@@ -0,0 +1,111 @@
+import json
+import os
+
+import pytest
+
+from utils.dataset import (
+    DatasetReader,
+    DatasetWriter,
+    dataset_path_for,
+    dataset_to_json,
+    json_to_dataset,
+    open_records,
+    write_dataset,
+)
+
+RECORDS = [{"id": i, "text": f"answer {i}\nwith a newline", "tags": ["a", "ü"]} for i in range(100)]
+
+
+def test_random_access_and_slicing(tmp_path):
+    path = tmp_path / "records.fbds"
+    assert write_dataset(path, RECORDS, chunk_size=7) == len(RECORDS)
+
+    with DatasetReader(path) as reader:
+        assert len(reader) == len(RECORDS)
+        assert list(reader) == RECORDS
+        assert reader[0] == RECORDS[0]
+        assert reader[50] == RECORDS[50]
+        assert reader[-1] == RECORDS[-1]
+        assert reader[13:41] == RECORDS[13:41]
+        assert reader[::9] == RECORDS[::9]
+        assert reader[95:500] == RECORDS[95:]
+        assert list(reader.iter_range(20, 22)) == RECORDS[20:22]
+
+        with pytest.raises(IndexError):
+            reader[len(RECORDS)]
+
+
+def test_empty_dataset(tmp_path):
+    path = tmp_path / "empty.fbds"
+    write_dataset(path, [])
+
+    with DatasetReader(path) as reader:
+        assert len(reader) == 0
+        assert list(reader) == []
+        assert reader[:] == []
+
+
+def test_rejects_non_dataset_file(tmp_path):
+    path = tmp_path / "bogus.fbds"
+    path.write_bytes(b"not a dataset at all, just some bytes padding it out")
+
+    with pytest.raises(ValueError):
+        DatasetReader(path)
+
+
+def test_json_round_trip(tmp_path):
+    json_path = tmp_path / "records.json"
+    json_path.write_text(json.dumps(RECORDS))
+
+    assert json_to_dataset(json_path, tmp_path / "records.fbds") == len(RECORDS)
+    assert dataset_to_json(tmp_path / "records.fbds", tmp_path / "back.json") == len(RECORDS)
+    assert json.loads((tmp_path / "back.json").read_text()) == RECORDS
+
+
+def test_failed_write_keeps_existing_dataset(tmp_path):
+    path = tmp_path / "records.fbds"
+    write_dataset(path, RECORDS[:3])
+
+    with pytest.raises(RuntimeError):
+        with DatasetWriter(path, chunk_size=2) as writer:
+            writer.extend(RECORDS[:10])
+            raise RuntimeError("generation failed")
+
+    with DatasetReader(path) as reader:
+        assert list(reader) == RECORDS[:3]
+    assert os.listdir(tmp_path) == ["records.fbds"]
+
+
+def test_open_records_prefers_newer_json(tmp_path):
+    json_path = tmp_path / "surveys.json"
+    dataset_path = dataset_path_for(json_path)
+
+    json_path.write_text(json.dumps(RECORDS[:2]))
+    write_dataset(dataset_path, RECORDS[:5])
+    os.utime(json_path, (1, 1))
+    with open_records(json_path) as records:
+        assert list(records) == RECORDS[:5]
+
+    json_path.write_text(json.dumps(RECORDS[:1]))
+    os.utime(dataset_path, (1, 1))
+    with open_records(json_path) as records:
+        assert list(records) == RECORDS[:1]
+
+
+def test_dataset_file_mode_matches_plain_files(tmp_path):
+    path = tmp_path / "records.fbds"
+    plain = tmp_path / "plain.json"
+    plain.write_text("[]")
+
+    write_dataset(path, RECORDS)
+    assert path.stat().st_mode & 0o777 == plain.stat().st_mode & 0o777
+
+    os.chmod(path, 0o640)
+    write_dataset(path, RECORDS[:1])
+    assert path.stat().st_mode & 0o777 == 0o640
+
+
+def test_dataset_to_json_is_compact(tmp_path):
+    write_dataset(tmp_path / "records.fbds", RECORDS[:2])
+    dataset_to_json(tmp_path / "records.fbds", tmp_path / "back.json")
+    assert (tmp_path / "back.json").read_text() == json.dumps(RECORDS[:2], separators=(",", ":")) + "\n"
@@ -0,0 +1,118 @@
+import copy
+import random
+import string
+
+from utils.dedup import (
+    ExactIndex,
+    MinHashLSH,
+    SurveyDeduplicator,
+    UserDeduplicator,
+    dedupe,
+)
+
+
+def _survey(name, question_id="q1", answer="The onboarding flow was quick and painless"):
+    return {
+        "name": name,
+        "questions": [{"id": question_id, "type": "openText", "question": "Thoughts?"}],
+        "responses": [{"data": {question_id: answer}}],
+    }
+
+
+def test_exact_index():
+    index = ExactIndex()
+    assert index.add("a@example.com")
+    assert not index.add("a@example.com")
+    assert "a@example.com" in index
+    assert "b@example.com" not in index
+
+
+def test_minhash_flags_near_duplicates():
+    index = MinHashLSH()
+    assert index.add("a", "Great team, very responsive") is None
+    assert index.add("b", "great team -- very responsive!!") == "a"
+    assert index.add("c", "Mobile app support would help a lot") is None
+
+
+def test_minhash_has_few_false_positives():
+    rng = random.Random(0)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(6)) for _ in range(2000)]
+    index = MinHashLSH()
+    collisions = sum(
+        index.add(str(i), " ".join(rng.choice(words) for _ in range(10))) is not None for i in range(3000)
+    )
+    assert collisions < 5
+
+
+def test_users_are_identified_by_email():
+    dedup = UserDeduplicator()
+    assert dedup.accept({"email": "john.smith@a.com", "name": "John Smith"})
+    assert not dedup.accept({"email": "JOHN.SMITH@a.com ", "name": "Someone Else"})
+
+    # Similar names with different emails are different people
+    assert dedup.accept({"email": "jsmithson@b.com", "name": "John Smithson"})
+    assert dedup.accept({"email": "sarah.lee@a.com", "name": "Sarah Lee"})
+    assert dedup.accept({"email": "sara.lee@b.com", "name": "Sara Lee"})
+
+    # Same local-part and near-identical name on another domain is a repeat
+    assert not dedup.accept({"email": "john.smith@c.com", "name": "john  smith."})
+
+
+def test_surveys_fix_question_ids_and_drop_repeated_answers():
+    dedup = SurveyDeduplicator()
+    first = _survey("Product Feedback", "q1")
+    second = _survey("Onboarding Experience", "q1")
+    second["responses"].append({"data": {"q1": "Support replied within minutes every time"}})
+    second["responses"].insert(0, {"data": {"q1": "Checkout kept timing out on mobile"}})
+
+    assert dedup.accept(first)
+    assert dedup.accept(second)
+    assert not dedup.accept(_survey("product feedback!"))
+
+    new_id = second["questions"][0]["id"]
+    assert new_id != "q1"
+    assert all(list(r["data"]) == [new_id] for r in second["responses"])
+    assert len(second["responses"]) == 2
+    assert dedup.dropped_responses == 1
+
+
+def test_dedupe_regenerates_only_collisions():
+    calls = []
+
+    def regenerate(count, avoid):
+        calls.append((count, list(avoid)))
+        return [_survey(f"Fresh survey number {len(calls)}", f"r{len(calls)}", f"unique answer text {len(calls)} here")]
+
+    surveys = [_survey("Alpha"), copy.deepcopy(_survey("Alpha"))]
+    kept, replaced, dropped = dedupe(surveys, SurveyDeduplicator(), regenerate)
+
+    assert [s["name"] for s in kept] == ["Alpha", "Fresh survey number 1"]
+    assert (replaced, dropped) == (1, 0)
+    assert calls == [(1, ["Alpha"])]
+
+
+def test_dedupe_stops_when_generator_has_nothing_new():
+    calls = []
+
+    def regenerate(count, avoid):
+        calls.append(count)
+        return []
+
+    users = [{"email": "a@x.com", "name": "A"}, {"email": "a@x.com", "name": "A"}]
+    kept, replaced, dropped = dedupe(users, UserDeduplicator(), regenerate, hint_field="email")
+
+    assert len(kept) == 1
+    assert (replaced, dropped) == (0, 1)
+    assert calls == [1]
+
+
+def test_repeated_question_id_keeps_answers_on_first_question():
+    dedup = SurveyDeduplicator()
+    survey = _survey("Product Feedback", "q1", "a")
+    survey["questions"].append({"id": "q1", "type": "openText", "question": "Anything else?"})
+
+    assert dedup.accept(survey)
+    first, second = survey["questions"]
+    assert first["id"] == "q1"
+    assert second["id"] != "q1"
+    assert survey["responses"][0]["data"] == {"q1": "a"}
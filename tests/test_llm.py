@@ -0,0 +1,32 @@
+import json
+
+from utils import llm
+from utils.llm import USER_CONTEXT, USER_SCHEMA, generate_users
+
+
+def test_retry_prompt_keeps_context_and_avoids_accepted_items(monkeypatch):
+    prompts = []
+    replies = [
+        json.dumps([{"email": "a@x.com", "name": "A", "role": "owner"}, {"email": "nope", "name": "B"}]),
+        json.dumps([{"email": "b@x.com", "name": "B", "role": "manager"}, {"email": "c@x.com", "name": "C"}]),
+    ]
+
+    def chat(api_key, prompt):
+        prompts.append(prompt)
+        return replies[len(prompts) - 1]
+
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setattr(llm, "_chat", chat)
+
+    users = generate_users(count=3, avoid=["old@x.com"], fallback=False)
+
+    assert [u["email"] for u in users] == ["a@x.com", "b@x.com", "c@x.com"]
+    assert len(prompts) == 2
+
+    retry = prompts[1]
+    assert USER_SCHEMA.strip() in retry
+    assert USER_CONTEXT in retry
+    assert '"email":"nope"' in retry
+    assert "email must be a valid email address" in retry
+    assert "Also generate 1 new, unique users." in retry
+    assert "old@x.com, a@x.com" in retry
@@ -0,0 +1,16 @@
+from main import build_parser
+
+
+def test_bare_profile_flag_keeps_command():
+    parser, _ = build_parser()
+    args = parser.parse_args(["--profile", "formbricks", "seed"])
+    assert (args.profile, args.profile_dir, args.command) == (True, "profiles", "seed")
+
+
+def test_profile_dir_option():
+    parser, _ = build_parser()
+    args = parser.parse_args(["--profile", "--profile-dir", "/tmp/prof", "formbricks", "generate"])
+    assert (args.profile, args.profile_dir, args.command) == (True, "/tmp/prof", "generate")
+
+    args = parser.parse_args(["formbricks", "verify"])
+    assert (args.profile, args.command) == (False, "verify")
@@ -0,0 +1,63 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from utils import profiling
+from utils.profiling import phase, profile_command
+
+
+def _command():
+    with phase("load"):
+        pass
+    with phase("load"):
+        pass
+    with phase("build"):
+        data = [str(i) * 10 for i in range(20000)]
+    return len(data)
+
+
+def _summary(tmp_path):
+    [summary_file] = tmp_path.glob("*.json")
+    return json.loads(summary_file.read_text())
+
+
+def test_writes_summary_and_pstats(tmp_path):
+    assert profile_command("seed", _command, str(tmp_path)) == 20000
+
+    summary = _summary(tmp_path)
+    assert summary["command"] == "seed"
+    assert summary["status"] == "ok"
+    assert Path(summary["pstats_file"]).exists()
+    assert summary["peak_memory_bytes"] > 0
+
+    phases = summary["phases"]
+    assert set(phases) == {"load", "build"}
+    assert phases["load"]["calls"] == 2
+    assert phases["build"]["calls"] == 1
+    assert all(entry["seconds"] >= 0 for entry in phases.values())
+
+    # Allocations are attributed to the line that built the data, not the profiler
+    top = phases["build"]["top_allocations"][0]
+    assert top["location"].startswith(__file__)
+    assert top["size_diff_bytes"] > 100000
+
+
+def test_records_error_status(tmp_path):
+    def failing():
+        with phase("load"):
+            raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        profile_command("generate", failing, str(tmp_path))
+
+    summary = _summary(tmp_path)
+    assert summary["status"] == "error"
+    assert summary["phases"]["load"]["calls"] == 1
+
+
+def test_phase_is_a_no_op_when_profiling_is_off():
+    with phase("load"):
+        pass
+    assert profiling._phases is None
+    assert profiling._baseline is None
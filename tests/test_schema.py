@@ -0,0 +1,90 @@
+import json
+
+from utils.schema import parse_items, repair_json, validate_survey, validate_user
+
+SURVEY = {
+    "name": "Product Feedback",
+    "description": "Help us improve",
+    "type": "form",
+    "questions": [
+        {"id": "q1", "type": "multipleChoice", "question": "Favourite feature?", "choices": ["A", "B"]},
+        {"id": "q2", "type": "rating", "question": "Rate us", "scale": 5},
+    ],
+    "responses": [{"data": {"q1": "A", "q2": 4}}],
+}
+
+
+def test_valid_json_is_not_rewritten():
+    users = [
+        {"email": "a@x.com", "name": "Alice “hi” Adams", "role": "owner"},
+        {"email": "b@x.com", "name": "Bob", "role": "manager"},
+    ]
+    assert parse_items(json.dumps(users, ensure_ascii=False)) == (users, 0)
+
+    items = [{"text": "use [a, ] here"}]
+    assert parse_items(json.dumps(items)) == (items, 0)
+
+
+def test_single_object_is_one_item():
+    assert parse_items(json.dumps(SURVEY)) == ([SURVEY], 0)
+
+
+def test_wrapped_array_is_unwrapped():
+    assert parse_items(json.dumps({"surveys": [SURVEY]})) == ([SURVEY], 0)
+    assert parse_items(json.dumps({"items": [SURVEY]})) == ([SURVEY], 0)
+
+    # Only known wrapper keys are unwrapped; other single-key objects are items
+    item = {"tags": ["a", "b"]}
+    assert parse_items(json.dumps(item)) == ([item], 0)
+
+
+def test_repairs_only_outside_strings():
+    content = '```json\n[{"text": "keep [a, ] and “these”",}, ]\n```'
+    assert json.loads(repair_json(content)) == [{"text": "keep [a, ] and “these”"}]
+
+    assert json.loads(repair_json("{“name”: “Bob”,}")) == {"name": "Bob"}
+
+
+def test_repairs_prose_and_trailing_commas():
+    content = 'Sure! Here you go:\n[{"email": "a@x.com",}, {"email": "b@x.com"},]\nEnjoy.'
+    assert parse_items(content) == ([{"email": "a@x.com"}, {"email": "b@x.com"}], 0)
+
+
+def test_salvages_items_around_a_broken_one():
+    content = '[{"email": "a@x.com"}, {"email": "b@x.com" "name": "B"}, {"email": "c@x.com"}]'
+    assert parse_items(content) == ([{"email": "a@x.com"}, {"email": "c@x.com"}], 1)
+
+
+def test_broken_single_object_does_not_yield_nested_dicts():
+    content = json.dumps(SURVEY)[:-10]
+    items, broken = parse_items(content)
+    assert items == []
+    assert broken == 1
+
+
+def test_validate_survey():
+    survey = json.loads(json.dumps(SURVEY))
+    survey["type"] = "Form"
+    survey["questions"][1]["scale"] = "5"
+    assert validate_survey(survey) == []
+    assert survey["type"] == "form"
+    assert survey["questions"][1]["scale"] == 5
+
+    survey["questions"][0]["choices"] = []
+    survey["responses"] = []
+    assert validate_survey(survey) == [
+        "questions[0]: choices must be a non-empty array of strings",
+        "responses must be a non-empty array",
+    ]
+
+
+def test_validate_user():
+    user = {"email": " a@x.com ", "name": "A", "role": "Owner"}
+    assert validate_user(user) == []
+    assert user == {"email": "a@x.com", "name": "A", "role": "owner"}
+
+    assert validate_user({"email": "nope", "name": "", "role": "admin"}) == [
+        "email must be a valid email address",
+        "name must be a non-empty string",
+        "role must be one of ['manager', 'owner']",
+    ]
@@ -0,0 +1,114 @@
+from commands.verify import _print_report, _verify_members, _verify_responses, _verify_surveys
+
+SURVEYS = [
+    {
+        "name": "Product Feedback",
+        "description": "Help us improve",
+        "type": "form",
+        "questions": [{"id": "q1", "type": "multipleChoice", "question": "Favourite?", "choices": ["A", "B"]}],
+        "responses": [{"data": {"q1": "A"}}, {"data": {"q1": "A"}}, {"data": {"q1": "B"}}],
+    },
+    {
+        "name": "Support Quality",
+        "description": "",
+        "type": "survey",
+        "questions": [{"id": "q1", "type": "openText", "question": "Thoughts?"}],
+        "responses": [{"data": {"q1": "Great"}}],
+    },
+]
+
+
+def _remote(survey, survey_id):
+    questions = []
+    for q in survey["questions"]:
+        question = {"type": q["type"], "headline": {"default": q["question"]}}
+        if q["type"] == "multipleChoice":
+            question["choices"] = [{"label": {"default": c}} for c in q["choices"]]
+        questions.append(question)
+    return {
+        "id": survey_id,
+        "name": survey["name"],
+        "description": survey["description"],
+        "type": survey["type"],
+        "questions": questions,
+    }
+
+
+class StubAPI:
+    def __init__(self, members=(), surveys=(), responses=None):
+        self.members = list(members)
+        self.surveys = list(surveys)
+        self.responses = responses or {}
+
+    def list_members(self):
+        return iter(self.members)
+
+    def list_surveys(self):
+        return iter(self.surveys)
+
+    def list_responses(self, survey_id):
+        return iter(self.responses.get(survey_id, []))
+
+
+def test_members():
+    users = [
+        {"email": "a@x.com", "role": "owner"},
+        {"email": "b@x.com", "role": "manager"},
+        {"email": "c@x.com", "role": "manager"},
+    ]
+    api = StubAPI(
+        members=[
+            {"email": "seed-1@formbricks.local", "role": "owner"},
+            {"email": "A@x.com", "role": "owner"},
+            {"email": "b@x.com", "role": "owner"},
+            {"email": "z@x.com", "role": "manager"},
+        ]
+    )
+
+    report = _verify_members(api, users)
+    assert report == {
+        "matched": 1,
+        "missing": [("c@x.com", 1)],
+        "extra": [("z@x.com", 1)],
+        "mismatched": [("b@x.com", 1)],
+    }
+
+
+def test_surveys():
+    changed = _remote(SURVEYS[1], "s2")
+    changed["questions"][0]["headline"] = {"default": "Something else?"}
+    api = StubAPI(surveys=[_remote(SURVEYS[0], "s1"), changed, _remote(SURVEYS[0], "dup"), {"name": "Other"}])
+
+    report, remote_ids = _verify_surveys(api, SURVEYS)
+    assert remote_ids == {"Product Feedback": "s1", "Support Quality": "s2"}
+    assert report == {
+        "matched": 1,
+        "missing": [],
+        "extra": [("Product Feedback", 1), ("Other", 1)],
+        "mismatched": [("Support Quality", 1)],
+    }
+
+    report, remote_ids = _verify_surveys(StubAPI(), SURVEYS)
+    assert remote_ids == {}
+    assert report["missing"] == [("Product Feedback", 1), ("Support Quality", 1)]
+
+
+def test_responses_compare_as_multisets():
+    api = StubAPI(responses={"s1": [{"data": {"q1": "A"}}, {"data": {"q1": "B"}}, {"data": {"q1": "B"}}]})
+
+    report = _verify_responses(api, SURVEYS, {"Product Feedback": "s1"})
+    assert report == {
+        "matched": 2,
+        "missing": [
+            ("Product Feedback: 1 responses", 1),
+            ("Support Quality: 1 responses (survey not found)", 1),
+        ],
+        "extra": [("Product Feedback: 1 responses", 1)],
+        "mismatched": [],
+    }
+
+
+def test_report_counts_records(capsys):
+    report = {"matched": 3, "missing": [("Survey: 5000 responses", 5000)], "extra": [("x@y.com", 1)], "mismatched": []}
+    assert _print_report("responses", report) == 5001
+    assert "3 matched, 5000 missing, 1 extra, 0 mismatched" in capsys.readouterr().out
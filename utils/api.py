@@ -3,8 +3,14 @@
 import requests
 import os
 import time
-from typing import Dict, Any, Optional
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterator, List, Optional
 import uuid
+from utils.profiling import phase
+
+PAGE_SIZE = 100
+PAGE_CONCURRENCY = 8
 
 
 class FormbricksAPI:
@@ -16,27 +22,36 @@ class FormbricksAPI:
         self.session_token = None
         self.workspace_id = None
 
+        # Shared by paginated reads so connections and worker threads are reused
+        self.session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=PAGE_CONCURRENCY)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self._pool = None
+
         self._initialize()
 
     def _initialize(self):
         """Initialize API connection and get authentication"""
         print(f"Initializing Formbricks API at {self.base_url}...")
 
-        max_retries = 30
-        for i in range(max_retries):
-            try:
-                response = requests.get(f"{self.base_url}/api/health", timeout=5)
-                if response.status_code < 500:
-                    print("✓ Connected to Formbricks")
-                    break
-            except requests.exceptions.RequestException:
-                if i < max_retries - 1:
-                    print(f"  Waiting for Formbricks... ({i + 1}/{max_retries})")
-                    time.sleep(2)
-                else:
-                    raise RuntimeError("Failed to connect to Formbricks after retries")
-
-        self._get_or_create_credentials()
+        with phase("health_wait"):
+            max_retries = 30
+            for i in range(max_retries):
+                try:
+                    response = requests.get(f"{self.base_url}/api/health", timeout=5)
+                    if response.status_code < 500:
+                        print("✓ Connected to Formbricks")
+                        break
+                except requests.exceptions.RequestException:
+                    if i < max_retries - 1:
+                        print(f"  Waiting for Formbricks... ({i + 1}/{max_retries})")
+                        time.sleep(2)
+                    else:
+                        raise RuntimeError("Failed to connect to Formbricks after retries")
+
+        with phase("credential_bootstrap"):
+            self._get_or_create_credentials()
 
     def _get_or_create_credentials(self):
         """Get or create API credentials for seeding"""
@@ -229,6 +244,98 @@ class FormbricksAPI:
         resp = response.json()
         return resp.get("id", str(uuid.uuid4()))
 
+    def list_surveys(self) -> Iterator[Dict[str, Any]]:
+        """Stream every survey in the workspace"""
+        return self._paginate(f"{self.base_url}/api/v1/workspaces/{self.workspace_id}/surveys")
+
+    def list_members(self) -> Iterator[Dict[str, Any]]:
+        """Stream every member of the workspace"""
+        return self._paginate(f"{self.base_url}/api/v1/workspaces/{self.workspace_id}/members")
+
+    def list_responses(self, survey_id: str) -> Iterator[Dict[str, Any]]:
+        """Stream every response to a survey through the Management API"""
+        return self._paginate(
+            f"{self.base_url}/api/v1/management/responses",
+            {"surveyId": survey_id},
+        )
+
+    def _paginate(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = PAGE_SIZE,
+        concurrency: int = PAGE_CONCURRENCY,
+    ) -> Iterator[Dict[str, Any]]:
+        """Yield items from a paginated endpoint in order
+
+        The first page is fetched on its own and its length becomes the step
+        for later skips, so a server that caps `limit` below page_size is still
+        read without gaps. While pages keep coming back full the number of
+        pages in flight doubles, up to `concurrency`, so large endpoints are
+        read in parallel. Stops on an empty page, or when a page repeats the
+        previous one (an endpoint that ignores skip/limit). Pages are compared
+        by item IDs when every item has one, since identical content is
+        legitimate otherwise.
+        """
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=PAGE_CONCURRENCY)
+
+        pending = deque()
+        page = self._get_page(url, params, 0, page_size)
+        step = min(len(page), page_size) or page_size
+        skip = step
+        window = 1
+        previous = None
+
+        try:
+            while page and self._page_key(page) != previous:
+                yield from page
+
+                previous = self._page_key(page)
+                window = min(window * 2, concurrency) if len(page) >= step else 1
+                while len(pending) < window:
+                    pending.append(self._pool.submit(self._get_page, url, params, skip, step))
+                    skip += step
+
+                page = pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+    @staticmethod
+    def _page_key(page: List[Dict[str, Any]]):
+        """Identify a page by its item IDs, falling back to its content"""
+        if all(isinstance(item, dict) and "id" in item for item in page):
+            return [item["id"] for item in page]
+        return page
+
+    def _get_page(self, url: str, params: Optional[Dict[str, Any]], skip: int, limit: int) -> List[Dict[str, Any]]:
+        """Fetch a single page of a list endpoint"""
+        query = dict(params or {})
+        query.update({"skip": skip, "limit": limit})
+
+        response = self.session.get(
+            url,
+            headers=self._get_headers(),
+            params=query,
+            timeout=30,
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Failed to fetch {url}: {response.text}")
+
+        body = response.json()
+        if isinstance(body, dict):
+            body = body.get("data", [])
+        return body
+
+    def close(self):
+        """Release the shared HTTP session and page-fetching threads"""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+        self.session.close()
+
     def _get_headers(self) -> Dict[str, str]:
         """Get API headers with authentication"""
         return {
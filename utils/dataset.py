@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+
+import bisect
+import json
+import mmap
+import os
+import stat
+import struct
+import tempfile
+import zlib
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Union
+
+# File layout:
+#   header  | MAGIC
+#   chunks  | zlib-compressed blocks of newline-delimited compact JSON records
+#   index   | one INDEX_ENTRY (offset, length, record count) per chunk
+#   footer  | index offset, chunk count, record count, MAGIC
+MAGIC = b"FBDSET01"
+INDEX_ENTRY = struct.Struct("<QQI")
+FOOTER = struct.Struct("<QIQ8s")
+
+DATASET_SUFFIX = ".fbds"
+DEFAULT_CHUNK_SIZE = 256
+
+
+class DatasetWriter:
+    """Write records to a chunked, compressed dataset file
+
+    Records go to a temporary file next to the target, which only replaces the
+    target once close() writes the footer. A write that fails part-way leaves
+    any existing dataset untouched.
+    """
+
+    def __init__(self, path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE, level: int = 6):
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+
+        self.path = Path(path)
+        self.chunk_size = chunk_size
+        self.level = level
+        self.record_count = 0
+
+        self._index = []
+        self._pending = []
+        fd, self._tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._file.write(MAGIC)
+
+    def append(self, record: Dict[str, Any]):
+        """Add a single record to the dataset"""
+        line = json.dumps(record, separators=(",", ":"), ensure_ascii=False)
+        self._pending.append(line.encode("utf-8"))
+        self.record_count += 1
+
+        if len(self._pending) >= self.chunk_size:
+            self._flush_chunk()
+
+    def extend(self, records: Iterable[Dict[str, Any]]):
+        """Add every record from an iterable"""
+        for record in records:
+            self.append(record)
+
+    def close(self):
+        """Flush pending records and write the index and footer"""
+        if self._file.closed:
+            return
+
+        self._flush_chunk()
+
+        index_offset = self._file.tell()
+        for entry in self._index:
+            self._file.write(INDEX_ENTRY.pack(*entry))
+        self._file.write(FOOTER.pack(index_offset, len(self._index), self.record_count, MAGIC))
+        self._file.close()
+
+        # mkstemp creates files readable only by their owner; give the dataset
+        # the permissions a plain open() would, or keep the existing file's
+        os.chmod(self._tmp_path, _target_mode(self.path))
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        """Discard everything written so far and leave the target untouched"""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def _flush_chunk(self):
+        if not self._pending:
+            return
+
+        block = zlib.compress(b"\n".join(self._pending), self.level)
+        self._index.append((self._file.tell(), len(block), len(self._pending)))
+        self._file.write(block)
+        self._pending = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def _target_mode(path: Path) -> int:
+    """Permission bits for a file about to replace path"""
+    try:
+        return stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class DatasetReader:
+    """Memory-mapped random access to a dataset written by DatasetWriter"""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError(f"Not a dataset file: {self.path}")
+
+        self._cached_chunk = None
+        self._cached_lines = None
+
+        try:
+            self._read_index()
+        except ValueError:
+            self.close()
+            raise
+
+    def _read_index(self):
+        size = len(self._map)
+        if size < len(MAGIC) + FOOTER.size or self._map[: len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a dataset file: {self.path}")
+
+        index_offset, chunk_count, record_count, magic = FOOTER.unpack_from(self._map, size - FOOTER.size)
+        if magic != MAGIC:
+            raise ValueError(f"Dataset file is truncated or corrupt: {self.path}")
+
+        self._chunks = [
+            INDEX_ENTRY.unpack_from(self._map, index_offset + i * INDEX_ENTRY.size)
+            for i in range(chunk_count)
+        ]
+
+        # First record index of every chunk, used to bisect a record to its chunk
+        self._starts = []
+        total = 0
+        for _, _, count in self._chunks:
+            self._starts.append(total)
+            total += count
+
+        if total != record_count:
+            raise ValueError(f"Dataset index does not match record count: {self.path}")
+        self._length = record_count
+
+    def _chunk_lines(self, chunk_no: int) -> List[bytes]:
+        if self._cached_chunk != chunk_no:
+            offset, length, _ = self._chunks[chunk_no]
+            block = zlib.decompress(self._map[offset : offset + length])
+            self._cached_lines = block.split(b"\n")
+            self._cached_chunk = chunk_no
+        return self._cached_lines
+
+    def _get(self, index: int) -> Dict[str, Any]:
+        chunk_no = bisect.bisect_right(self._starts, index) - 1
+        lines = self._chunk_lines(chunk_no)
+        return json.loads(lines[index - self._starts[chunk_no]])
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, key):
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step == 1:
+                return list(self.iter_range(start, stop))
+            return [self._get(i) for i in range(start, stop, step)]
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("dataset index out of range")
+        return self._get(key)
+
+    def iter_range(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """Yield records in [start, stop), decompressing only the chunks that overlap it"""
+        stop = self._length if stop is None else min(stop, self._length)
+        start = max(start, 0)
+        if start >= stop:
+            return
+
+        chunk_no = bisect.bisect_right(self._starts, start) - 1
+        index = start
+        while index < stop:
+            lines = self._chunk_lines(chunk_no)
+            first = self._starts[chunk_no]
+            end = min(stop, first + len(lines))
+            for line in lines[index - first : end - first]:
+                yield json.loads(line)
+            index = end
+            chunk_no += 1
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return self.iter_range()
+
+    def close(self):
+        """Release the memory map and file handle"""
+        self._cached_lines = None
+        self._cached_chunk = None
+        if not self._map.closed:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_dataset(path: Union[str, Path], records: Iterable[Dict[str, Any]], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Write records to a dataset file and return how many were written"""
+    with DatasetWriter(path, chunk_size=chunk_size) as writer:
+        writer.extend(records)
+    return writer.record_count
+
+
+def json_to_dataset(json_path: Union[str, Path], dataset_path: Union[str, Path], chunk_size: int = DEFAULT_CHUNK_SIZE) -> int:
+    """Convert a JSON array file into a dataset file"""
+    with open(json_path) as f:
+        records = json.load(f)
+
+    if not isinstance(records, list):
+        raise ValueError(f"Expected a JSON array in {json_path}")
+
+    return write_dataset(dataset_path, records, chunk_size=chunk_size)
+
+
+def dataset_to_json(dataset_path: Union[str, Path], json_path: Union[str, Path]) -> int:
+    """Convert a dataset file back into a JSON array file"""
+    count = 0
+    with DatasetReader(dataset_path) as reader, open(json_path, "w") as f:
+        f.write("[")
+        for record in reader:
+            if count:
+                f.write(",")
+            json.dump(record, f, separators=(",", ":"))
+            count += 1
+        f.write("]\n")
+    return count
+
+
+def dataset_path_for(json_path: Union[str, Path]) -> Path:
+    """Return the dataset file that sits next to a JSON data file"""
+    return Path(json_path).with_suffix(DATASET_SUFFIX)
+
+
+@contextmanager
+def open_records(json_path: Union[str, Path]):
+    """Open the records for a data file, preferring the indexed dataset unless the JSON is newer"""
+    json_path = Path(json_path)
+    dataset_path = dataset_path_for(json_path)
+    json_is_newer = json_path.exists() and (
+        not dataset_path.exists() or json_path.stat().st_mtime > dataset_path.stat().st_mtime
+    )
+    if dataset_path.exists() and not json_is_newer:
+        with DatasetReader(dataset_path) as reader:
+            yield reader
+        return
+
+    with open(json_path) as f:
+        records = json.load(f)
+    yield records
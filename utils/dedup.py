@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+
+import hashlib
+import re
+import uuid
+import zlib
+from typing import List, Dict, Any, Callable, Iterable, Optional
+from utils.profiling import phase
+
+NUM_PERM = 64
+BANDS = 8
+MIN_ANSWER_WORDS = 4
+MAX_REGENERATE_ROUNDS = 3
+MAX_AVOID_HINTS = 50
+NAME_SIMILARITY = 0.6
+
+_NON_WORD = re.compile(r"[^\w\s]+")
+_SPACES = re.compile(r"\s+")
+_GOLDEN_64 = 0x9E3779B97F4A7C15
+_MASK_64 = (1 << 64) - 1
+
+
+def normalize(text: Any) -> str:
+    """Lowercase text and strip punctuation and repeated whitespace"""
+    text = _NON_WORD.sub(" ", str(text).lower())
+    return _SPACES.sub(" ", text).strip()
+
+
+class ExactIndex:
+    """Set of fixed-size digests for exact-match lookups on keys such as emails and IDs"""
+
+    def __init__(self):
+        self._digests = set()
+
+    def _digest(self, key: str) -> bytes:
+        return hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+
+    def __contains__(self, key: str) -> bool:
+        return self._digest(key) in self._digests
+
+    def add(self, key: str) -> bool:
+        """Add a key, returning False if it was already present"""
+        digest = self._digest(key)
+        if digest in self._digests:
+            return False
+        self._digests.add(digest)
+        return True
+
+
+class MinHashLSH:
+    """Locality-sensitive index that flags texts with high shingle overlap
+
+    Each text is reduced to a one-permutation MinHash signature: every shingle
+    is hashed once into one of NUM_PERM bins and each bin keeps its minimum.
+    The signature is split into BANDS bands and two texts collide when any
+    band matches, which becomes likely once their Jaccard similarity passes
+    roughly (1 / bands) ** (1 / rows). Lookups and inserts are O(1) in the
+    index size, so a pass over N texts is O(N).
+    """
+
+    def __init__(self, num_perm: int = NUM_PERM, bands: int = BANDS, shingle_size: int = 3):
+        if num_perm & (num_perm - 1) or num_perm % bands:
+            raise ValueError("num_perm must be a power of two divisible by bands")
+
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self._bin_shift = 64 - (num_perm.bit_length() - 1)
+        self._value_mask = (1 << self._bin_shift) - 1
+        self._buckets = [dict() for _ in range(bands)]
+
+    def _signature(self, text: str) -> List[int]:
+        num_perm = self.num_perm
+        shift = self._bin_shift
+        value_mask = self._value_mask
+
+        signature = [None] * num_perm
+        for shingle in _shingles(normalize(text), self.shingle_size):
+            # crc32 is fast but has weak low bits, so spread it with a multiplicative hash
+            h = (zlib.crc32(shingle.encode("utf-8")) * _GOLDEN_64) & _MASK_64
+            slot = h >> shift
+            value = h & value_mask
+            current = signature[slot]
+            if current is None or value < current:
+                signature[slot] = value
+
+        # Fill empty bins from the next non-empty one, offset by the distance
+        for slot in range(num_perm):
+            if signature[slot] is None:
+                distance = 1
+                while signature[(slot + distance) % num_perm] is None:
+                    distance += 1
+                signature[slot] = signature[(slot + distance) % num_perm] + (distance << shift)
+
+        return signature
+
+    def _band_keys(self, text: str) -> List[int]:
+        signature = self._signature(text)
+        rows = self.rows
+        return [hash(tuple(signature[b * rows : (b + 1) * rows])) for b in range(self.bands)]
+
+    def add(self, key: str, text: str) -> Optional[str]:
+        """Index a text, returning the key of an earlier near-duplicate if one exists"""
+        band_keys = self._band_keys(text)
+        for bucket, band_key in zip(self._buckets, band_keys):
+            match = bucket.get(band_key)
+            if match is not None:
+                return match
+
+        for bucket, band_key in zip(self._buckets, band_keys):
+            bucket[band_key] = key
+        return None
+
+
+class SurveyDeduplicator:
+    """Track surveys already accepted into a dataset and reject duplicates"""
+
+    def __init__(self):
+        self.names = MinHashLSH()
+        self.question_ids = ExactIndex()
+        self.answers = MinHashLSH()
+        self.dropped_responses = 0
+
+    def accept(self, survey: Dict[str, Any]) -> bool:
+        """Index a survey, returning False if its name duplicates an earlier survey"""
+        name = survey.get("name", "")
+        if self.names.add(name, name) is not None:
+            return False
+
+        self._fix_question_ids(survey)
+        self._dedupe_responses(survey)
+        return True
+
+    def _fix_question_ids(self, survey: Dict[str, Any]):
+        """Give colliding question IDs fresh UUIDs instead of regenerating the survey
+
+        Answers only follow a renamed question when its ID came from another
+        survey; if an earlier question in this survey already has the ID, the
+        answers stay with that earlier question.
+        """
+        seen = set()
+        for question in survey.get("questions", []):
+            question_id = question.get("id")
+            if question_id is None:
+                continue
+
+            while not self.question_ids.add(question["id"]):
+                question["id"] = str(uuid.uuid4())
+
+            repeated = question_id in seen
+            seen.add(question_id)
+            if question["id"] != question_id and not repeated:
+                for response in survey.get("responses", []):
+                    data = response.get("data", {})
+                    if question_id in data:
+                        data[question["id"]] = data.pop(question_id)
+
+    def _dedupe_responses(self, survey: Dict[str, Any]):
+        """Drop responses whose free-text answers repeat an earlier answer"""
+        kept = []
+        for response in survey.get("responses", []):
+            texts = [
+                value
+                for value in response.get("data", {}).values()
+                if isinstance(value, str) and len(value.split()) >= MIN_ANSWER_WORDS
+            ]
+            duplicate = False
+            for text in texts:
+                if self.answers.add(text, text) is not None:
+                    duplicate = True
+
+            # A survey always keeps at least one response
+            if duplicate and kept:
+                self.dropped_responses += 1
+            else:
+                kept.append(response)
+
+        if "responses" in survey:
+            survey["responses"] = kept
+
+
+class UserDeduplicator:
+    """Track users already accepted into a dataset and reject duplicates
+
+    Identity is the email address. A user with a new email is only treated as
+    a duplicate when its email local-part matches an earlier user's and the
+    names are near-identical, so distinct people who share a common name are
+    kept.
+    """
+
+    def __init__(self):
+        self.emails = ExactIndex()
+        self._names_by_local_part: Dict[str, List[set]] = {}
+
+    def accept(self, user: Dict[str, Any]) -> bool:
+        """Index a user, returning False if it duplicates an earlier user"""
+        email = user.get("email", "").strip().lower()
+        if email in self.emails:
+            return False
+
+        local_part = normalize(email.split("@")[0])
+        name = _shingles(normalize(user.get("name", "")))
+        earlier = self._names_by_local_part.setdefault(local_part, [])
+        if any(jaccard(name, other) >= NAME_SIMILARITY for other in earlier):
+            return False
+
+        earlier.append(name)
+        self.emails.add(email)
+        return True
+
+
+def _shingles(text: str, size: int = 3) -> set:
+    if len(text) <= size:
+        return {text}
+    return {text[i : i + size] for i in range(len(text) - size + 1)}
+
+
+def jaccard(a: set, b: set) -> float:
+    """Jaccard similarity of two shingle sets"""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def dedupe(
+    records: Iterable[Dict[str, Any]],
+    deduplicator,
+    regenerate: Optional[Callable[[int, List[str]], List[Dict[str, Any]]]] = None,
+    hint_field: str = "name",
+    max_rounds: int = MAX_REGENERATE_ROUNDS,
+):
+    """Keep unique records and regenerate only the ones that collide
+
+    Every record is checked once against the deduplicator's indexes, so a pass
+    is linear in the number of records. Rejected records are replaced by calling
+    regenerate(count, avoid) for at most max_rounds rounds; regenerate returns an
+    empty list when it cannot produce new items, which ends the loop. Anything
+    still colliding is dropped. Returns (records, replaced_count, dropped_count).
+    """
+    accepted = []
+    duplicates = 0
+
+    with phase("dedup"):
+        for record in records:
+            if deduplicator.accept(record):
+                accepted.append(record)
+            else:
+                duplicates += 1
+
+    needed = duplicates
+    for _ in range(max_rounds):
+        if not needed or regenerate is None:
+            break
+
+        avoid = [str(r.get(hint_field, "")) for r in accepted[-MAX_AVOID_HINTS:]]
+        with phase("dedup_regenerate"):
+            pending = regenerate(needed, avoid)
+        if not pending:
+            break
+
+        with phase("dedup"):
+            for record in pending:
+                if needed and deduplicator.accept(record):
+                    accepted.append(record)
+                    needed -= 1
+
+    return accepted, duplicates - needed, needed
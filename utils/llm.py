@@ -2,20 +2,13 @@
 
 import json
 import os
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Callable, Optional, Tuple
 import requests
+from utils.schema import parse_items, validate_survey, validate_user
 
+MAX_ITEM_RETRIES = 2
 
-def generate_surveys() -> List[Dict[str, Any]]:
-    """Generate 5 realistic surveys using LLM"""
-
-    api_key = os.getenv("OPENAI_API_KEY")
-    if not api_key:
-        print("⚠ OPENAI_API_KEY not set. Using mock data instead.")
-        return generate_mock_surveys()
-
-    prompt = """Generate exactly 5 unique, realistic survey objects for a customer feedback platform.
-Each survey should have:
+SURVEY_SCHEMA = """Each survey should have:
 - name: string
 - description: string
 - type: "form" or "survey"
@@ -27,71 +20,216 @@ Each survey should have:
   - scale: number (for rating/nps)
 - responses: array with at least 1 realistic response object, each containing:
   - data: object with question IDs as keys and answers as values
+"""
+
+USER_SCHEMA = """Each user should have:
+- email: string (realistic email address)
+- name: string (realistic full name)
+- role: "manager" or "owner"
+"""
+
+SURVEY_CONTEXT = "Make surveys realistic: Product feedback, Customer satisfaction, NPS survey, Feature request survey, Support quality survey."
+USER_CONTEXT = "Make them diverse and realistic names/emails."
+
+
+def generate_surveys(
+    count: int = 5, avoid: Optional[List[str]] = None, fallback: bool = True
+) -> List[Dict[str, Any]]:
+    """Generate realistic surveys using LLM, avoiding the given survey names
 
-Make surveys realistic: Product feedback, Customer satisfaction, NPS survey, Feature request survey, Support quality survey.
+    Without fallback, an empty list is returned instead of mock data when the
+    LLM is unavailable, so callers asking for new items never get repeats.
+    """
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        if not fallback:
+            return []
+        print("⚠ OPENAI_API_KEY not set. Using mock data instead.")
+        return generate_mock_surveys()[:count]
+
+    prompt = f"""Generate exactly {count} unique, realistic survey objects for a customer feedback platform.
+{SURVEY_SCHEMA}
+{SURVEY_CONTEXT}
 Return ONLY valid JSON array, no markdown formatting."""
+    prompt += _avoid_clause("survey names", avoid)
 
     try:
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={
-                "model": "gpt-3.5-turbo",
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.7,
-            },
+        surveys = _generate_items(
+            api_key,
+            prompt,
+            f"{SURVEY_SCHEMA}{SURVEY_CONTEXT}",
+            count,
+            validate_survey,
+            "surveys",
+            avoid,
+            "name",
+            "survey names",
         )
-
-        response.raise_for_status()
-        result = response.json()
-
-        content = result["choices"][0]["message"]["content"]
-        surveys = json.loads(content)
+        if not surveys:
+            raise ValueError("no valid surveys in LLM output")
         return surveys
 
     except Exception as e:
+        if not fallback:
+            print(f"⚠ LLM generation failed: {str(e)}.")
+            return []
         print(f"⚠ LLM generation failed: {str(e)}. Using mock data instead.")
-        return generate_mock_surveys()
+        return generate_mock_surveys()[:count]
+
 
+def generate_users(
+    count: int = 10, avoid: Optional[List[str]] = None, fallback: bool = True
+) -> List[Dict[str, Any]]:
+    """Generate realistic users using LLM, avoiding the given email addresses
 
-def generate_users() -> List[Dict[str, Any]]:
-    """Generate 10 realistic users using LLM"""
+    Without fallback, an empty list is returned instead of mock data when the
+    LLM is unavailable, so callers asking for new items never get repeats.
+    """
 
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
+        if not fallback:
+            return []
         print("⚠ OPENAI_API_KEY not set. Using mock data instead.")
-        return generate_mock_users()
-
-    prompt = """Generate exactly 10 unique, realistic user objects for a feedback platform.
-Each user should have:
-- email: string (realistic email address)
-- name: string (realistic full name)
-- role: "manager" or "owner"
+        return generate_mock_users()[:count]
 
-Make them diverse and realistic names/emails.
+    prompt = f"""Generate exactly {count} unique, realistic user objects for a feedback platform.
+{USER_SCHEMA}
+{USER_CONTEXT}
 Return ONLY valid JSON array, no markdown formatting."""
+    prompt += _avoid_clause("email addresses", avoid)
 
     try:
-        response = requests.post(
-            "https://api.openai.com/v1/chat/completions",
-            headers={"Authorization": f"Bearer {api_key}"},
-            json={
-                "model": "gpt-3.5-turbo",
-                "messages": [{"role": "user", "content": prompt}],
-                "temperature": 0.7,
-            },
+        users = _generate_items(
+            api_key,
+            prompt,
+            f"{USER_SCHEMA}{USER_CONTEXT}",
+            count,
+            validate_user,
+            "users",
+            avoid,
+            "email",
+            "email addresses",
         )
-
-        response.raise_for_status()
-        result = response.json()
-
-        content = result["choices"][0]["message"]["content"]
-        users = json.loads(content)
+        if not users:
+            raise ValueError("no valid users in LLM output")
         return users
 
     except Exception as e:
+        if not fallback:
+            print(f"⚠ LLM generation failed: {str(e)}.")
+            return []
         print(f"⚠ LLM generation failed: {str(e)}. Using mock data instead.")
-        return generate_mock_users()
+        return generate_mock_users()[:count]
+
+
+def _chat(api_key: str, prompt: str) -> str:
+    """Send a single-message chat completion and return the reply text"""
+    response = requests.post(
+        "https://api.openai.com/v1/chat/completions",
+        headers={"Authorization": f"Bearer {api_key}"},
+        json={
+            "model": "gpt-3.5-turbo",
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": 0.7,
+        },
+    )
+
+    response.raise_for_status()
+    result = response.json()
+
+    return result["choices"][0]["message"]["content"]
+
+
+def _generate_items(
+    api_key: str,
+    prompt: str,
+    context: str,
+    count: int,
+    validate: Callable[[Any], List[str]],
+    label: str,
+    avoid: Optional[List[str]],
+    key_field: str,
+    avoid_label: str,
+) -> List[Dict[str, Any]]:
+    """Request items from the LLM, keeping valid ones and re-prompting only for the rest
+
+    Re-prompts repeat the task context and ask the LLM to avoid both the
+    caller's values and the key_field of every item already accepted.
+    """
+    items, broken = parse_items(_chat(api_key, prompt))
+    valid, invalid = _split_valid(items, validate)
+    if broken:
+        print(f"⚠ Skipped {broken} unparsable {label} in LLM output")
+
+    for attempt in range(1, MAX_ITEM_RETRIES + 1):
+        missing = max(count - len(valid) - len(invalid), 0)
+        if not invalid and not missing:
+            break
+
+        print(
+            f"⚠ Re-requesting {len(invalid) + missing} invalid or missing {label} "
+            f"(attempt {attempt}/{MAX_ITEM_RETRIES})"
+        )
+        taken = list(avoid or []) + [str(item.get(key_field, "")) for item in valid]
+        try:
+            content = _chat(api_key, _retry_prompt(context, invalid, missing, label, avoid_label, taken))
+        except Exception as e:
+            print(f"⚠ Retry failed: {str(e)}. Keeping {len(valid)} valid {label}.")
+            break
+
+        items, _ = parse_items(content)
+        fixed, invalid = _split_valid(items, validate)
+        valid.extend(fixed)
+
+    return valid[:count]
+
+
+def _split_valid(items: List[Any], validate: Callable[[Any], List[str]]):
+    """Split items into valid ones and (item, errors) pairs for invalid ones"""
+    valid = []
+    invalid = []
+    for item in items:
+        errors = validate(item)
+        if errors:
+            invalid.append((item, errors))
+        else:
+            valid.append(item)
+    return valid, invalid
+
+
+def _retry_prompt(
+    context: str,
+    invalid: List[Tuple[Any, List[str]]],
+    missing: int,
+    label: str,
+    avoid_label: str,
+    avoid: Optional[List[str]] = None,
+) -> str:
+    """Build a follow-up prompt that covers only the invalid and missing items"""
+    parts = [f"You are generating realistic {label} for a customer feedback platform.", context.strip()]
+
+    if invalid:
+        parts.append(f"These {label} failed validation. Fix each one:")
+        for item, errors in invalid:
+            parts.append(f"- {json.dumps(item, separators=(',', ':'))}")
+            parts.append(f"  errors: {'; '.join(errors)}")
+
+    if missing:
+        parts.append(f"Also generate {missing} new, unique {label}.")
+    if avoid:
+        parts.append(_avoid_clause(avoid_label, avoid).strip())
+
+    parts.append(f"Return ONLY a JSON array of exactly {len(invalid) + missing} {label}, no markdown formatting.")
+    return "\n".join(parts)
+
+
+def _avoid_clause(label: str, avoid: Optional[List[str]]) -> str:
+    """Prompt suffix asking the LLM not to repeat existing values"""
+    if not avoid:
+        return ""
+    return f"\nDo not reuse any of these existing {label}: {', '.join(avoid)}."
 
 
 def generate_mock_surveys() -> List[Dict[str, Any]]:
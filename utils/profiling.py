@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+
+import cProfile
+import json
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Any, Optional
+
+TOP_ALLOCATIONS = 25
+TOP_FUNCTIONS = 25
+
+# Per-phase timings for the running command, None while profiling is off
+_phases: Optional[Dict[str, Dict[str, Any]]] = None
+
+# tracemalloc snapshot taken when the command started
+_baseline: Optional[tracemalloc.Snapshot] = None
+
+
+@contextmanager
+def phase(name: str):
+    """Record wall-clock time spent in a named phase when profiling is enabled
+
+    The first time a phase finishes, memory allocated since the command
+    started is also snapshotted, while the phase's data is still alive.
+    """
+    if _phases is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        entry = _phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+        entry["seconds"] += elapsed
+        entry["calls"] += 1
+
+        if "top_allocations" not in entry and _baseline is not None:
+            entry["top_allocations"] = _top_allocations(tracemalloc.take_snapshot(), _baseline)
+
+
+def profile_command(command: str, func: Callable[[], Any], output_dir: str = "profiles") -> Any:
+    """Run a command under cProfile and tracemalloc and write a profile report"""
+    global _phases, _baseline
+
+    out_dir = Path(output_dir).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    started_at = datetime.now(timezone.utc)
+    stem = f"{command}-{started_at.strftime('%Y%m%dT%H%M%S.%fZ')}"
+    suffix = 1
+    while (out_dir / f"{stem}.json").exists():
+        suffix += 1
+        stem = f"{command}-{started_at.strftime('%Y%m%dT%H%M%S.%fZ')}-{suffix}"
+    stats_file = out_dir / f"{stem}.pstats"
+    summary_file = out_dir / f"{stem}.json"
+
+    _phases = {}
+    profiler = cProfile.Profile()
+    tracemalloc.start()
+    _baseline = tracemalloc.take_snapshot()
+    start = time.perf_counter()
+    status = "ok"
+
+    try:
+        profiler.enable()
+        try:
+            return func()
+        finally:
+            profiler.disable()
+    except BaseException:
+        status = "error"
+        raise
+    finally:
+        wall_seconds = time.perf_counter() - start
+        top_allocations = _top_allocations(tracemalloc.take_snapshot(), _baseline)
+        _, peak_bytes = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        _baseline = None
+        phases, _phases = _phases, None
+
+        profiler.dump_stats(str(stats_file))
+
+        summary = {
+            "command": command,
+            "status": status,
+            "started_at": started_at.isoformat(),
+            "wall_seconds": round(wall_seconds, 6),
+            "peak_memory_bytes": peak_bytes,
+            "phases": {
+                name: dict(entry, seconds=round(entry["seconds"], 6))
+                for name, entry in phases.items()
+            },
+            "top_functions": _top_functions(profiler),
+            "top_allocations": top_allocations,
+            "pstats_file": str(stats_file),
+        }
+
+        with open(summary_file, "w") as f:
+            json.dump(summary, f, indent=2)
+
+        print(f"\n✓ Profile written to {summary_file} (pstats: {stats_file})")
+
+
+def _top_functions(profiler: cProfile.Profile):
+    """Return the most expensive functions by cumulative time"""
+    stats = pstats.Stats(profiler)
+    rows = []
+    for (filename, line, name), (_, ncalls, tottime, cumtime, _) in stats.stats.items():
+        rows.append(
+            {
+                "function": f"{filename}:{line}({name})",
+                "calls": ncalls,
+                "total_seconds": round(tottime, 6),
+                "cumulative_seconds": round(cumtime, 6),
+            }
+        )
+    rows.sort(key=lambda row: row["cumulative_seconds"], reverse=True)
+    return rows[:TOP_FUNCTIONS]
+
+
+def _top_allocations(snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot):
+    """Return the source lines whose allocations grew the most since the baseline"""
+    filters = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, __file__),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    ]
+    snapshot = snapshot.filter_traces(filters)
+    baseline = baseline.filter_traces(filters)
+
+    diffs = [stat for stat in snapshot.compare_to(baseline, "lineno") if stat.size_diff > 0]
+    diffs.sort(key=lambda stat: stat.size_diff, reverse=True)
+
+    rows = []
+    for stat in diffs[:TOP_ALLOCATIONS]:
+        frame = stat.traceback[0]
+        rows.append(
+            {
+                "location": f"{frame.filename}:{frame.lineno}",
+                "size_diff_bytes": stat.size_diff,
+                "count_diff": stat.count_diff,
+                "size_bytes": stat.size,
+            }
+        )
+    return rows
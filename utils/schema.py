@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+
+import json
+import re
+import uuid
+from typing import List, Dict, Any, Tuple
+
+SURVEY_TYPES = {"form", "survey"}
+QUESTION_TYPES = {"openText", "multipleChoice", "rating", "nps"}
+USER_ROLES = {"manager", "owner"}
+
+_EMAIL = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+_FENCE = re.compile(r"^```[a-zA-Z]*\s*|\s*```$")
+_CLOSES_CONTAINER = re.compile(r"\s*[\]}]")
+_OPEN_QUOTES = {'"': '"', "“": "”"}
+_WRAPPER_KEYS = {"surveys", "users", "items"}
+
+
+def repair_json(content: str) -> str:
+    """Fix common LLM JSON defects outside string literals
+
+    Strips markdown fences and prose around the JSON, turns smart quotes used
+    as string delimiters into plain quotes and drops trailing commas. String
+    contents are never touched.
+    """
+    text = _FENCE.sub("", content.strip())
+
+    array_start = text.find("[")
+    object_start = text.find("{")
+    if array_start != -1 and (object_start == -1 or array_start < object_start):
+        text = text[array_start : text.rfind("]") + 1 or len(text)]
+    elif object_start != -1:
+        text = text[object_start : text.rfind("}") + 1 or len(text)]
+
+    out = []
+    closing = None
+    escaped = False
+    for i, char in enumerate(text):
+        if closing is not None:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == closing or (closing == "”" and char == '"'):
+                closing = None
+                char = '"'
+        elif char in _OPEN_QUOTES:
+            closing = _OPEN_QUOTES[char]
+            char = '"'
+        elif char == "," and _CLOSES_CONTAINER.match(text, i + 1):
+            continue
+        out.append(char)
+
+    return "".join(out)
+
+
+def _unwrap(value: Any):
+    """Return the item list from a decoded reply, or None if it has no items"""
+    if isinstance(value, dict):
+        # {"surveys": [...]} style wrappers
+        if len(value) == 1:
+            key, items = next(iter(value.items()))
+            if key in _WRAPPER_KEYS and isinstance(items, list):
+                return items
+        return [value]
+    if isinstance(value, list):
+        return value
+    return None
+
+
+def parse_items(content: str) -> Tuple[List[Any], int]:
+    """Parse an LLM JSON array, salvaging every item that decodes on its own
+
+    Valid JSON is used as-is; the repair pass only runs when it fails to parse.
+    Returns the decoded items and the number of items that could not be decoded.
+    """
+    try:
+        items = _unwrap(json.loads(content))
+        if items is not None:
+            return items, 0
+    except json.JSONDecodeError:
+        pass
+
+    text = repair_json(content)
+
+    try:
+        items = _unwrap(json.loads(text))
+        if items is not None:
+            return items, 0
+    except json.JSONDecodeError:
+        pass
+
+    # Walk the top-level objects one at a time so a single broken object
+    # only loses itself instead of the whole completion
+    decoder = json.JSONDecoder()
+    items = []
+    broken = 0
+    pos = text.find("{")
+    while pos != -1:
+        try:
+            item, end = decoder.raw_decode(text, pos)
+            items.append(item)
+            pos = text.find("{", end)
+        except json.JSONDecodeError:
+            broken += 1
+            pos = _next_top_level_object(text, pos)
+
+    return items, broken
+
+
+def _next_top_level_object(text: str, pos: int) -> int:
+    """Find the start of the object after the broken one that begins at pos"""
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(pos, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text.find("{", i + 1)
+    return -1
+
+
+def validate_survey(survey: Any) -> List[str]:
+    """Coerce trivially fixable fields and return the remaining schema errors"""
+    if not isinstance(survey, dict):
+        return ["survey must be an object"]
+
+    errors = []
+
+    if not isinstance(survey.get("name"), str) or not survey["name"].strip():
+        errors.append("name must be a non-empty string")
+
+    if not isinstance(survey.get("description", ""), str):
+        errors.append("description must be a string")
+
+    survey_type = survey.get("type", "form")
+    if isinstance(survey_type, str):
+        survey["type"] = survey_type = survey_type.strip().lower()
+    if survey_type not in SURVEY_TYPES:
+        errors.append(f"type must be one of {sorted(SURVEY_TYPES)}")
+
+    questions = survey.get("questions")
+    if not isinstance(questions, list) or not questions:
+        errors.append("questions must be a non-empty array")
+        questions = []
+
+    for n, question in enumerate(questions):
+        errors.extend(f"questions[{n}]: {e}" for e in _validate_question(question))
+
+    responses = survey.get("responses")
+    if not isinstance(responses, list) or not responses:
+        errors.append("responses must be a non-empty array")
+        responses = []
+
+    for n, response in enumerate(responses):
+        if not isinstance(response, dict) or not isinstance(response.get("data"), dict):
+            errors.append(f"responses[{n}]: data must be an object")
+
+    return errors
+
+
+def _validate_question(question: Any) -> List[str]:
+    if not isinstance(question, dict):
+        return ["question must be an object"]
+
+    errors = []
+
+    if not question.get("id"):
+        question["id"] = str(uuid.uuid4())
+    elif not isinstance(question["id"], str):
+        question["id"] = str(question["id"])
+
+    if question.get("type") not in QUESTION_TYPES:
+        errors.append(f"type must be one of {sorted(QUESTION_TYPES)}")
+
+    if not isinstance(question.get("question"), str) or not question["question"].strip():
+        errors.append("question must be a non-empty string")
+
+    if question.get("type") == "multipleChoice":
+        choices = question.get("choices")
+        if not isinstance(choices, list) or not choices or not all(isinstance(c, str) for c in choices):
+            errors.append("choices must be a non-empty array of strings")
+
+    if "scale" in question:
+        scale = question["scale"]
+        if isinstance(scale, str) and scale.strip().isdigit():
+            question["scale"] = scale = int(scale)
+        if not isinstance(scale, int) or isinstance(scale, bool) or scale < 1:
+            errors.append("scale must be a positive integer")
+
+    return errors
+
+
+def validate_user(user: Any) -> List[str]:
+    """Coerce trivially fixable fields and return the remaining schema errors"""
+    if not isinstance(user, dict):
+        return ["user must be an object"]
+
+    errors = []
+
+    email = user.get("email")
+    if isinstance(email, str):
+        user["email"] = email = email.strip()
+    if not isinstance(email, str) or not _EMAIL.match(email):
+        errors.append("email must be a valid email address")
+
+    if not isinstance(user.get("name"), str) or not user["name"].strip():
+        errors.append("name must be a non-empty string")
+
+    role = user.get("role", "manager")
+    if isinstance(role, str):
+        user["role"] = role = role.strip().lower()
+    if role not in USER_ROLES:
+        errors.append(f"role must be one of {sorted(USER_ROLES)}")
+
+    return errors